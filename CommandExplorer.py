@@ -4,8 +4,12 @@
 
 # Created 2022 by James Bishop (james@bishopdynamics.com)
 
+import sys
+import logging
 
 from Mod_MainWindow import MainWindow
 
 if __name__ == '__main__':
+    # log messages go to the console, same as print would
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO, format='%(message)s')
     win = MainWindow()
@@ -5,10 +5,10 @@
 #   DialogContractExplorer.py is baked from DialogContractExplorer.ui
 
 # Created 2022 by James Bishop (james@bishopdynamics.com)
-import uuid
+import itertools
 import tkinter
 
-from Mod_Util import print_traceback, list_to_dict
+from Mod_Util import print_traceback
 from UI_DialogContractExplorer import DialogContractExplorerUI
 
 
@@ -19,7 +19,10 @@ class DialogContractExplorer(DialogContractExplorerUI):
         self.setup_ui()
         self.contracts = contracts
         self.contract_nodes = []  # track all the tree nodes as we make them so we can iterate for expand and collapse
+        self._node_counter = itertools.count()  # cheap unique ids for tree nodes
+        self.pending_nodes = {}  # data for nodes whose children have not been inserted yet, by node id
         self.combobox_values = {}
+        self._contract_by_id = {}  # lookup contract by id, for when combobox selection changes
         self.combobox_textvariable = tkinter.StringVar()
         self.window.after(100, self.setup_backend)  # schedule setup_backend to run within the loop
         self.run_loop()
@@ -30,6 +33,7 @@ class DialogContractExplorer(DialogContractExplorerUI):
         self.load_contract(self.contracts[0])
         self.button_expand.config(command=self.expand_tree)
         self.button_collapse.config(command=self.collapse_tree)
+        self.treeview_result.bind('<<TreeviewOpen>>', self.treeview_opened)
         self.populate_combobox()
         self.ready()
 
@@ -43,54 +47,101 @@ class DialogContractExplorer(DialogContractExplorerUI):
 
     def expand_tree(self):
         # expand all items of treeview
-        for item in self.contract_nodes:
-            self.treeview_result.item(item, open=True)
+        self.treeview_result.grid_remove()  # out of the layout while we work, so tk redraws once at the end
+        try:
+            # first fill in every node that has not been opened yet, this also adds their children to contract_nodes
+            while self.pending_nodes:
+                self.populate_node(next(iter(self.pending_nodes)))
+            self.set_tree_open(True)
+        finally:
+            self.treeview_result.grid()
 
     def collapse_tree(self):
         # collapse all items of treeview
-        for item in self.contract_nodes:
-            self.treeview_result.item(item, open=False)
-
-    def json_tree(self, tree, parent, dictionary, node_list):
-        for key in dictionary:
-            uid = uuid.uuid4()
-            node_list.append(uid)
-            if isinstance(dictionary[key], dict):
-                tree.insert(parent, 'end', uid, text=key)
-                self.json_tree(tree, uid, dictionary[key], node_list)
-            elif isinstance(dictionary[key], list):
-                tree.insert(parent, 'end', uid, text=key + ':')
-                self.json_tree(tree, uid, list_to_dict(dictionary[key]), node_list)
+        self.treeview_result.grid_remove()  # out of the layout while we work, so tk redraws once at the end
+        try:
+            self.set_tree_open(False)
+        finally:
+            self.treeview_result.grid()
+
+    def set_tree_open(self, is_open: bool):
+        # open or close every tracked node, skipping the ones that are already in that state
+        item = self.treeview_result.item
+        getboolean = self.treeview_result.tk.getboolean
+        for node in self.contract_nodes:
+            if getboolean(item(node, 'open')) != is_open:
+                item(node, open=is_open)
+
+    def json_tree(self, tree, parent, data, node_list):
+        # insert one level of data (a dict, or a list using index as key) under parent
+        #   nested dicts and lists get a placeholder child so they can be opened, and are filled in by populate_node
+        #   this runs once per node, so grab what we need up front
+        #   contract data is plain json, so comparing exact types is enough (and cheaper than isinstance)
+        insert = tree.insert
+        add_node = node_list.append
+        node_counter = self._node_counter
+        pending_nodes = self.pending_nodes
+        _dict = dict
+        _list = list
+        entries = data.items() if type(data) is _dict else enumerate(data)
+        for key, value in entries:
+            uid = f'n{next(node_counter)}'
+            add_node(uid)
+            value_type = type(value)
+            if value_type is _dict or value_type is _list:
+                insert(parent, 'end', uid, text=key if value_type is _dict else key + ':')
+                if value:
+                    insert(uid, 'end', text='')  # placeholder, replaced with the real children when opened
+                    pending_nodes[uid] = value
             else:
-                value = dictionary[key]
-                if value is None:
-                    value = 'None'
-                value = '"%s"' % value
-                tree.insert(parent, 'end', uid, text=key, value=value)
+                # values is a sequence, one entry per column, so the value is a single entry even if it has spaces
+                insert(parent, 'end', uid, text=key, values=(str(value),))
+
+    def populate_node(self, uid):
+        # replace the placeholder under a node with its real children, if not done already
+        data = self.pending_nodes.pop(uid, None)
+        if data is None:
+            return
+        self.treeview_result.delete(*self.treeview_result.get_children(uid))
+        self.json_tree(self.treeview_result, uid, data, self.contract_nodes)
+
+    def treeview_opened(self, event):
+        # a node was opened, make sure its children are there
+        self.populate_node(self.treeview_result.focus())
 
     def load_contract(self, contract: dict):
         # load contract data into treeview
         try:
             # load first contract into treeview
             self.contract_nodes = []  # store nodes for later expand and collapse
-            # clear out existing nodes
-            for item in self.treeview_result.get_children():
-                self.treeview_result.delete(item)
-            # now populate it from the contract
-            self.json_tree(self.treeview_result, '', contract, self.contract_nodes)
+            self.pending_nodes = {}
+            # take the treeview out of the layout while we fill it, so tk redraws once at the end instead of per insert
+            #   grid_remove remembers the grid options, so a bare grid() puts it back exactly where it was
+            self.treeview_result.grid_remove()
+            try:
+                # clear out existing nodes
+                for item in self.treeview_result.get_children():
+                    self.treeview_result.delete(item)
+                # now populate the top level from the contract, deeper levels are added as they are opened
+                self.json_tree(self.treeview_result, '', contract, self.contract_nodes)
+            finally:
+                self.treeview_result.grid()
         except Exception as ex:
             print('failed to load contract: %s' % ex)
             print_traceback()
 
     def populate_combobox(self, ):
-        sorted_contracts = sorted(self.contracts, key=lambda x: str(x['vendor']).lower())
-        for contract in sorted_contracts:
-            item_display = '%s (%s) %s - %s' % (contract['vendor'], contract['id'], contract['start'], contract['end'])
-            item_value = contract['id']
-            self.combobox_values[item_display] = item_value
-        values = list(self.combobox_values.keys())
+        # reversed so that the first contract with a given id wins, same as a linear search would
+        self._contract_by_id = {contract['id']: contract for contract in reversed(self.contracts)}
+        # sort by vendor, case-insensitive, computing each key once up front (index breaks ties, keeping the sort stable)
+        sort_keys = [(str(contract['vendor']).lower(), i) for i, contract in enumerate(self.contracts)]
+        sort_keys.sort()
+        sorted_contracts = [self.contracts[i] for _, i in sort_keys]
+        # (display string, contract id) for each contract, in sorted order
+        items = [(f"{contract['vendor']} ({contract['id']}) {contract['start']} - {contract['end']}", contract['id']) for contract in sorted_contracts]
+        self.combobox_values = dict(items)
         self.combobox_contracts['textvariable'] = self.combobox_textvariable
-        self.combobox_contracts['values'] = values
+        self.combobox_contracts['values'] = list(self.combobox_values)
         self.combobox_contracts.current(0)
         self.combobox_contracts.bind('<<ComboboxSelected>>', self.combobox_changed)
 
@@ -98,9 +149,5 @@ class DialogContractExplorer(DialogContractExplorerUI):
         item_display = event.widget.get()
         selected_contract_id = self.combobox_values[item_display]
         print('got contract id: %s' % selected_contract_id)
-        selected_contract = {}
-        for contract in self.contracts:
-            if contract['id'] == selected_contract_id:
-                selected_contract = contract
-                break
+        selected_contract = self._contract_by_id.get(selected_contract_id, {})
         self.load_contract(selected_contract)
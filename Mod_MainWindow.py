@@ -9,8 +9,15 @@
 import platform
 import sys
 import json
+import logging
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # use the C parser from libyaml when available
+except ImportError:
+    from yaml import SafeLoader
+
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 
 from UI_MainWindow import MainWindowUI
@@ -21,12 +28,14 @@ from Mod_Util import print_traceback, print_obj
 from Mod_DialogContractExplorer import DialogContractExplorer
 from Mod_ThreadWorkers import ThreadWorkerCommunicator, TicketCreator
 
+logger = logging.getLogger(__name__)
+
 
 class MainWindow(MainWindowUI):
     def __init__(self):
         super().__init__()
-        self.setup_ui()
-        self.log = []
+        self.safe_setup_ui()
+        self.log = deque()  # oldest first, same order as the console and the saved file
         self.thread_pool = ThreadPoolExecutor(max_workers=5)
         self.communicators = []
         self.config = {}
@@ -36,16 +45,10 @@ class MainWindow(MainWindowUI):
     def log_msg(self, message):
         # write text to the log and console
         timestamp = get_timestamp()
-        print('%s - %s' % (timestamp, message))
-        self.log.append([timestamp, message])
-        # reverse the log order for the UI table, but not for the console or file output
-        log_reversed = self.log.copy()
-        log_reversed.reverse()
-        # clear the table
-        self.table_log.delete(*self.table_log.get_children())
-        # now repopulate it
-        for index, entry in enumerate(log_reversed):
-            self.table_log.insert('', index=index, values=entry)
+        logger.info('%s - %s', timestamp, message)  # formatting is left to logging, and skipped if info is disabled
+        self.log.append((timestamp, message))
+        # the UI table is newest at top, so insert just the new row at the top instead of rebuilding the whole table
+        self.add_log_row(timestamp, message)
 
     def read_config(self):
         # load config from file, else return useless defaults, but maintaining schema
@@ -58,7 +61,7 @@ class MainWindow(MainWindowUI):
             self.log_msg('Loading config from: %s' % str(CONFIG_FILE))
             try:
                 with open(CONFIG_FILE) as cf:
-                    config = yaml.load(cf, Loader=yaml.FullLoader)
+                    config = yaml.load(cf, Loader=SafeLoader)
                 self.log_msg('Autosave mins: %s' % config['saving']['mins_autosave_timeout'])
                 return config
             except Exception as ex:
@@ -151,7 +154,8 @@ class MainWindow(MainWindowUI):
 
     def clear_log(self):
         # clear the log window in the UI, as well as the history. does not affect what is printed to console
-        self.log = []
+        self.log.clear()
+        self.clear_log_rows()
         self.log_msg('Log cleared')
         return None
 
@@ -161,7 +165,7 @@ class MainWindow(MainWindowUI):
         homedir = pathlib.Path.home().joinpath('Downloads')
         filename = homedir.joinpath('CommandExplorer_log_%s.txt' % timestamp)
         with open(filename, 'w') as of:
-            for i, (timestamp, message) in enumerate(self.log):
-                of.write('%s - %s \n' % (timestamp, message))
+            # build the whole file and write it once, instead of one write per line
+            of.write(''.join('%s - %s \n' % (timestamp, message) for timestamp, message in self.log))
         self.log_msg('Log saved to %s' % str(filename))
         return None
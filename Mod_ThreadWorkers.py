@@ -8,10 +8,9 @@
 import time
 from abc import abstractmethod
 
-from threading import Thread
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from queue import Queue
+from queue import Queue, Empty
 
 from Mod_Util import print_traceback, print_obj
 
@@ -19,15 +18,15 @@ from Mod_Util import print_traceback, print_obj
 class ThreadChannel(object):
     # communications channel for sending arbitrary data back to parent thread, via queue
     #   a ThreadChannel has a name and a type, and we try to enforce type
-    #   data is sent to a queue, which can then be checked regularly
-    def __init__(self, parent_name, name,  var_type: type):
+    #   data is sent to a queue shared by all channels of a worker, tagged with the channel name
+    #   ThreadWorkerChannels checks that queue regularly, and hands data back to the channel it was sent on
+    def __init__(self, parent_name, name,  var_type: type, queue: Queue):
         self.parent_name = parent_name
         self.name = name
-        self.queue = Queue(maxsize=0)  # TODO do we care about limiting queue size?
+        self.queue = queue
         self.var_type = var_type
         self.debug = False  # set to True to get more debug info printed to console
         self.var_type_str = var_type.__name__
-        self.max_entries_per_loop = 4  # for any loop cycle, process the queue until empty, or N entries processed
         self.callbacks = []  # list of funcitons to call, passing data
 
     def log_msg(self, message: str):
@@ -44,7 +43,7 @@ class ThreadChannel(object):
                 error_msg = 'send wrong type: %s' % str(type(data))
                 self.log_msg(error_msg)
                 raise Exception(error_msg)
-            self.queue.put(data)
+            self.queue.put((self.name, data))
         except Exception as ex:
             self.log_msg('Error while sending: %s' % ex)
 
@@ -54,65 +53,70 @@ class ThreadChannel(object):
         # TODO we want to somehow validate that the callable takes the right number of args, and of the right type
         self.callbacks.append(on_data)
 
-    def run_loop(self):
-        # for any data in the queue, call each callback with that data
+    def dispatch(self, data: any):
+        # call each callback with data that was received on this channel
         try:
-            num_processed = 0  # track how many we have processed so far, to compare to max
-            while not self.queue.empty():
-                this_data = self.queue.get()
-                for this_callback in self.callbacks:
+            for this_callback in self.callbacks:
+                if self.debug:
                     self.log_msg('calling: %s' % this_callback.__name__)
-                    this_callback(this_data)
-                num_processed += 1
-                if num_processed >= self.max_entries_per_loop:
-                    break  # only process N entries per loop, so as not to hog the parent thread
+                this_callback(data)
         except Exception as ex:
-            self.log_msg('Error in run_loop: %s' % ex)
+            self.log_msg('Error in dispatch: %s' % ex)
 
 
 class ThreadWorkerChannels(object):
+    # the set of channels for a worker, all sharing one queue so that checking for messages is a single pass
     def __init__(self, parent_name):
         self.parent_name = parent_name
-        self.progress = ThreadChannel(self.parent_name, 'progress', int)
-        self.status = ThreadChannel(self.parent_name, 'status', str)
-        self.error = ThreadChannel(self.parent_name, 'error', str)
-        self.success = ThreadChannel(self.parent_name, 'success', bool)
-        self.result = ThreadChannel(self.parent_name, 'result', object)
+        self.queue = Queue(maxsize=0)  # entries are (channel name, data)  TODO do we care about limiting queue size?
+        self.max_entries_per_loop = 20  # for any loop cycle, process the queue until empty, or N entries processed
+        self.progress = ThreadChannel(self.parent_name, 'progress', int, self.queue)
+        self.status = ThreadChannel(self.parent_name, 'status', str, self.queue)
+        self.error = ThreadChannel(self.parent_name, 'error', str, self.queue)
+        self.success = ThreadChannel(self.parent_name, 'success', bool, self.queue)
+        self.result = ThreadChannel(self.parent_name, 'result', object, self.queue)
+        self.channels = {channel.name: channel for channel in (self.progress, self.status, self.error, self.success, self.result)}
 
     def run_loop(self):
-        # run each of the channel's loops once
-        self.progress.run_loop()
-        self.status.run_loop()
-        self.error.run_loop()
-        self.success.run_loop()
-        self.result.run_loop()
+        # for any data in the queue, hand it to the channel it was sent on
+        #   this runs every loop cycle, so grab what we need from self up front
+        channels = self.channels
+        queue_get = self.queue.get_nowait
+        # only process N entries per loop, so as not to hog the parent thread
+        for _ in range(self.max_entries_per_loop):
+            try:
+                channel_name, this_data = queue_get()  # a single lock acquisition, instead of empty() followed by get()
+            except Empty:
+                break
+            try:
+                channels[channel_name].dispatch(this_data)
+            finally:
+                self.queue.task_done()  # mark it handled, so that join() knows when everything sent has been processed
+
+    def join(self, timeout: float = None):
+        # block until everything sent on any channel has been handled by the parent thread, or until timeout seconds pass
+        #   returns False if we gave up waiting, like Queue.join but with a timeout
+        with self.queue.all_tasks_done:
+            return self.queue.all_tasks_done.wait_for(lambda: not self.queue.unfinished_tasks, timeout)
 
 
 class ThreadWorker(object):
     # base ThreadWorker class
     def __init__(self, name):
         self.name = name
-        self.loop_delay = 0.1  # seconds, how often to check queues
+        self.flush_timeout = 5  # seconds, how long to wait for the parent thread to handle our messages when done
         self.debug = True  # enable to print more messages
-        self.monitor_thread = Thread(target=self.run_loop, daemon=True)
         self.channels = ThreadWorkerChannels(parent_name=self.name)
 
     def cleanup(self):
-        # clean up our monitor thread
+        # clean up anything the worker is holding on to, nothing by default
         self.log_msg('Cleaning up')
-        self.monitor_thread._stop()
 
     def log_msg(self, message):
         # how to we want to log a message?
         if self.debug:
             print('ThreadWorker %s : %s' % (self.name, message))
 
-    def run_loop(self):
-        # repeatedly check for messages in channels
-        while True:
-            self.channels.run_loop()
-            time.sleep(self.loop_delay)
-
     def report_progress(self, progress: int):
         # report progress as 0-100 int
         self.channels.progress.send(progress)
@@ -140,13 +144,15 @@ class ThreadWorker(object):
         # this is what gets run
         self.log_msg('Starting')
         self.report_status('Starting')
-        self.monitor_thread.start()
         self.report_progress(0)
         try:
             self.thread_action()
         except Exception as ex:
             print('Error while running threadworker: %s' % ex)
-        time.sleep(0.2)  # let messages flush
+        # wait for the parent thread to handle all our messages before we clean up
+        #   with a timeout, because if the parent has gone away (window closed) nobody will ever handle them
+        if not self.channels.join(timeout=self.flush_timeout):
+            self.log_msg('Timed out waiting for messages to be handled')
         self.cleanup()
         self.log_msg('Complete')
 
@@ -163,6 +169,7 @@ class ThreadWorker(object):
 class ThreadWorkerCommunicator:
     # handles communication with a threadworker, progressbar, statuslabel, and handling result
     #   a communicator's job is to run in the parent thread, regularly checking for new items in queues that are filled by the child thread
+    #   checking is scheduled with window.after, so callbacks always run on the tk thread, which is the only thread allowed to touch widgets
     def __init__(self, window, name, worker: ThreadWorker, thread_pool: ThreadPoolExecutor, message_function: callable, result_function: callable, progressbar=None, statuslabel=None):
         self.window = window
         self.worker = worker
@@ -174,6 +181,10 @@ class ThreadWorkerCommunicator:
         self.name = name
         self.debug = True  # enable to print debug messages
         self.thread_future = None
+        self.loop_delay = 100  # milliseconds, how often to check the worker's channels
+        self.progress_flush_interval = 0.016  # seconds, minimum time between forced redraws of the progressbar (~60Hz)
+        self.last_progress = -1
+        self.last_progress_flush = 0.0
         self.setup()
 
     def log_msg(self, message):
@@ -199,14 +210,32 @@ class ThreadWorkerCommunicator:
             self.thread_future = self.thread_pool.submit(self.worker.run)
             # Note: you can also do: result = self.thread_pool.map(function, values)
             #   where values is an array, and result will be an array of results, one per value
+            self.window.after(self.loop_delay, self.run_loop)
         except Exception as ex:
             print('error while running worker: %s' % ex)
             print_traceback()
 
+    def run_loop(self):
+        # check for messages from the worker, then schedule the next check, until the worker is done and everything is handled
+        self.worker.channels.run_loop()
+        if self.thread_future.done() and self.worker.channels.queue.empty():
+            self.log_msg('Done checking for messages')
+            return
+        self.window.after(self.loop_delay, self.run_loop)
+
     def on_progress(self, progress: int):
         # update a progress bar if assigned
+        #   workers can report progress much faster than anyone can see it, so only force a redraw at most every progress_flush_interval
+        #   the mainloop will still redraw any skipped value on its own, and 100 is always flushed
         if self.progressbar:
+            if progress == self.last_progress:
+                return
+            self.last_progress = progress
             self.progressbar['value'] = progress
+            now = time.monotonic()
+            if now - self.last_progress_flush < self.progress_flush_interval and progress < 100:
+                return
+            self.last_progress_flush = now
             self.window.update_idletasks()
 
     def on_status(self, status: str):
@@ -234,6 +263,15 @@ class TicketCreator(ThreadWorker):
     def __init__(self, items: list):
         super().__init__('TicketCreator')
         self.items = items
+        self.max_concurrent = 10  # how many tickets to create at once, each one is mostly waiting on the network
+
+    def create_ticket(self, item: dict):
+        # create the ticket(s) for a single contract, runs in its own thread
+        contract_id = item['id']
+        # work starts here
+        self.report_status('Creating tickets for Contract ID: %s' % contract_id)
+        time.sleep(1)  # TODO placeholder for the actual JIRA api call
+        # work done
 
     def thread_action(self):
         # create tickets based on self.contracts_processed
@@ -246,17 +284,19 @@ class TicketCreator(ThreadWorker):
             count = 0
             self.report_status('Creating tickets for %s selected contracts' % num_selected)
             self.report_progress(5)
-            for item in self.items:
-                contract_id = item['id']
-                progress = round(((count + 1) / num_selected) * 100)  # offset so that you can tell things have started
-                # work starts here
-                self.report_status('Creating tickets for Contract ID: %s' % contract_id)
-                time.sleep(1)
-                # work done
-                self.report_progress(progress)
-                # print(progress)
-                num_created += 1  # track how many we actually create
-                count += 1
+            # tickets do not depend on each other, so create them concurrently instead of one after another
+            with ThreadPoolExecutor(max_workers=self.max_concurrent) as ticket_pool:
+                futures = [ticket_pool.submit(self.create_ticket, item) for item in self.items]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        num_created += 1  # track how many we actually create
+                    except Exception as ex:
+                        self.report_status('Skipped a contract, error while creating ticket: %s' % ex)
+                        num_skipped += 1
+                    count += 1
+                    progress = round((count / num_selected) * 100)
+                    self.report_progress(progress)
             self.report_progress(100)
             self.report_status('Of %s selected contracts, %s tickets were created, and %s were skipped' % (num_selected, num_created, num_skipped))
             self.report_result({
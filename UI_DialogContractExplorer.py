@@ -65,8 +65,7 @@ class DialogContractExplorerUI(object):
             # the top section, which has fixed height
             frame_top_section = tkinter.Frame(frame_root, height=200)
             frame_top_section.columnconfigure(0, weight=1)
-            for i in range(0, 3):
-                frame_top_section.rowconfigure(i, weight=1)
+            frame_top_section.rowconfigure((0, 1, 2), weight=1)
             frame_top_section.grid(column=0, row=0, sticky='ewn', padx=self.default_pad, pady=self.default_pad)
 
             # close button
@@ -79,8 +78,7 @@ class DialogContractExplorerUI(object):
 
             # frame_buttons 2c x 1r holds the two buttons: expand and collapse
             frame_buttons = tkinter.Frame(frame_top_section)
-            frame_buttons.columnconfigure(0, weight=1)
-            frame_buttons.columnconfigure(1, weight=1)  # 2 cols
+            frame_buttons.columnconfigure((0, 1), weight=1)  # 2 cols
             frame_buttons.rowconfigure(0, weight=1)
             frame_buttons.grid(column=0, row=2, sticky='ew', padx=self.default_pad, pady=self.default_pad)  # position in parent frame
 
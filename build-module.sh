@@ -0,0 +1,41 @@
+#!/bin/bash
+# Optional: compile UI_MainWindow.py into a native module with nuitka, for faster startup
+#   nuitka puts UI_MainWindow.<platform>.so next to UI_MainWindow.py, and python imports the .so instead of the .py when both exist
+#   the .so does NOT update when you edit UI_MainWindow.py, run this again, or delete the .so to go back to the plain .py
+
+# Created 2022 by James Bishop (james@bishopdynamics.com)
+
+MODULE_NAME='UI_MainWindow'
+VENV_NAME='venv'
+
+function bail() {
+	echo "An unexpected error occurred"
+	exit 1
+}
+
+# create venv if missing
+if [ ! -d "$VENV_NAME" ]; then
+  ./setup-venv.sh || bail
+fi
+
+# we need modules in the venv
+source "${VENV_NAME}/bin/activate" || bail
+
+# nuitka is optional, so it is not in requirements.txt
+python -m nuitka --version > /dev/null 2>&1 || {
+  echo "nuitka not found, install it into the venv first: source ${VENV_NAME}/bin/activate && pip install nuitka"
+  deactivate
+  bail
+}
+
+# remove any previous build, so we never end up importing a stale one
+rm -f ${MODULE_NAME}.*.so
+
+python -m nuitka --module ${MODULE_NAME}.py --remove-output --no-pyi-file || {
+  deactivate
+  bail
+}
+
+# all done, deactivate the venv
+deactivate
+echo "Success, resulting module: $(ls ${MODULE_NAME}.*.so)"